@@ -1,2 +1,2 @@
 from .titration import titration, solution
-from .k_values import k_values
+from .k_values import k_values, k_at_temperature, kw_at_temperature
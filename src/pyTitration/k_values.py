@@ -30,4 +30,151 @@ k_values['base'] = pd.DataFrame().reindex_like(k_values['acid'])
 
 k_values['base'][k_values['acid'] > 0] = 10**-(14 + np.log10(k_values['acid'][k_values['acid'] > 0]))
 k_values['base'].fillna(0, inplace=True)
-k_values['base'] = k_values['base'].transform(np.sort).iloc[::-1]
\ No newline at end of file
+k_values['base'] = k_values['base'].transform(np.sort).iloc[::-1]
+
+# Standard reaction enthalpies in kJ/mol of the dissociation steps belonging
+# to the K values in k_values['acid'], valid at 25 °C. They are used for the
+# van 't Hoff extrapolation of the K values to other temperatures. For strong
+# acids and where no data is available, 0 is given, i.e. the corresponding K
+# value is treated as temperature independent.
+dh_values = {}
+dh_values['acid'] = pd.DataFrame([], index=k_values['acid'].index)
+
+acid_enthalpies = []
+acid_enthalpies.append(pd.Series([0, 0, 0], name='hydrochloric acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([-8.0, 3.6, 16.0], name='phosphoric acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([0, -22.4, 0], name='sulfuric acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([-0.41, 0, 0], name='acetic acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([4.07, 2.23, -3.38], name='citric acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([0, 0, 0], name='methacrylic acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([9.15, 14.7, 0], name='carbonic acid', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([14.8, 0, 0], name='2-(N-morpholino)ethanesulfonic acid (MES)', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([0, 20.4, 0], name='4-(2-hydroxyethyl)-1-piperazineethanesulfonic acid (HEPES)', index=dh_values['acid'].index))
+acid_enthalpies.append(pd.Series([51.95, 0, 0], name='ammonium chloride', index=dh_values['acid'].index))
+# The K value of water is derived from pkw_values in k_at_temperature, so no
+# reaction enthalpy is needed.
+acid_enthalpies.append(pd.Series([0, 0, 0], name='water', index=dh_values['acid'].index))
+
+dh_values['acid'] = pd.concat([dh_values['acid']] + acid_enthalpies, axis=1)
+
+# Tabulated pK_w values of pure water between 0 and 100 °C, used as the lookup
+# table for kw_at_temperature. The table range is also the temperature range
+# allowed in k_at_temperature.
+pkw_values = pd.Series(
+    [14.943, 14.535, 14.167, 13.995, 13.833, 13.535, 13.262, 13.017, 12.800,
+     12.598, 12.422, 12.265],
+    index=[0, 10, 20, 25, 30, 40, 50, 60, 70, 80, 90, 100],
+    name='pK_w')
+
+gas_constant = 8.314462618E-3  # kJ/(mol K)
+
+# The water concentration in mol/L implied by the K value of water in
+# k_values['acid'] together with the ion product of 1E-14 used for
+# k_values['base'].
+c_water = 1E-14/k_values['acid']['water'].iloc[0]
+
+
+def _check_temperature(temperature):
+    temperature = np.asarray(temperature, dtype=float)
+    t_min, t_max = pkw_values.index.min(), pkw_values.index.max()
+    if (temperature < t_min).any() or (temperature > t_max).any():
+        raise ValueError(
+            'The temperature must be between {} and {} °C, but is {}.'.format(
+                t_min, t_max, temperature))
+    return temperature
+
+
+def kw_at_temperature(temperature):
+    """
+    Look up the ion product of water at one or more temperatures.
+
+    The values are interpolated linearly in log10(K_w) over the reciprocal
+    absolute temperature from the table in pkw_values, so that arbitrary
+    temperature arrays are processed in one call.
+
+    Parameters
+    ----------
+    temperature : float or ndarray
+        The temperature(s) in °C. Must be between 0 and 100 °C.
+
+    Returns
+    -------
+    float or ndarray
+        The ion product of water at the given temperature(s), with the same
+        shape as temperature.
+
+    """
+    temperature = _check_temperature(temperature)
+
+    # np.interp needs increasing x values, so the reciprocal temperatures are
+    # reversed.
+    inv_t_table = 1/(pkw_values.index.values + 273.15)
+    pkw = np.interp(1/(temperature + 273.15), inv_t_table[::-1],
+                    pkw_values.values[::-1])
+    kw = 10**-pkw
+    return kw if kw.ndim else kw.item()
+
+
+def k_at_temperature(compound, temperature, t_ref=25, kind='acid'):
+    """
+    Calculate the dissociation constants of a compound at one or more
+    temperatures.
+
+    The K values from k_values['acid'] are extrapolated with the van 't Hoff
+    equation using the reaction enthalpies from dh_values['acid']. The
+    reaction enthalpies are assumed to be constant, so the results become less
+    reliable the further the temperature is from t_ref. The K value of water
+    is calculated from kw_at_temperature instead, so that it is consistent
+    with the ion product of water used in the titration calculations.
+
+    Parameters
+    ----------
+    compound : str
+        The name of the compound, must be a column in k_values['acid'].
+    temperature : float or ndarray
+        The temperature(s) in °C. Must be between 0 and 100 °C.
+    t_ref : float, optional
+        The temperature in °C the K values and reaction enthalpies are valid
+        for. The default is 25.
+    kind : str, optional
+        Can either be 'acid' or 'base'. If it is 'base', the base
+        dissociation constants are returned like in k_values['base'], but
+        calculated with the ion product of water from kw_at_temperature
+        instead of 1E-14. The default is 'acid'.
+
+    Returns
+    -------
+    ndarray
+        The dissociation constants. For a single temperature, the shape is
+        (3,) like the columns in k_values['acid']. For an array of
+        temperatures, an additional leading axis is added, i.e. the shape is
+        (len(temperature), 3). Acid dissociation constants can be used for
+        the k_analyte and k_titrant arguments of titration.curve_grid.
+
+    """
+    if compound not in k_values['acid'].columns:
+        raise ValueError(
+            'No K values available for \'{}\'.'.format(compound))
+    if kind not in ['acid', 'base']:
+        raise ValueError('kind must either be \'acid\' or \'base\', but is '
+                         '\'{}\'.'.format(kind))
+
+    temperature = _check_temperature(temperature)
+    k_ref = k_values['acid'][compound].values
+    dh = dh_values['acid'][compound].values
+
+    if compound == 'water':
+        k_acid = np.zeros(temperature.shape + k_ref.shape)
+        k_acid[..., 0] = kw_at_temperature(temperature)/c_water
+    else:
+        inv_t_diff = (1/(temperature[..., np.newaxis] + 273.15) -
+                      1/(t_ref + 273.15))
+        k_acid = k_ref * np.exp(-dh/gas_constant * inv_t_diff)
+
+    if kind == 'acid':
+        return k_acid
+
+    kw = np.asarray(kw_at_temperature(temperature))[..., np.newaxis]
+    k_base = np.zeros_like(k_acid)
+    np.divide(kw, k_acid, out=k_base, where=k_acid > 0)
+    return np.sort(k_base, axis=-1)[..., ::-1]
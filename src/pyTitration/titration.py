@@ -79,6 +79,103 @@ class solution():
     def _calc_equation_value(self, c_h_plus):
         return float(self.equation.subs({'h_plus': c_h_plus}))
 
+    def _fit_k_solutes(self, k_solutes):
+        if isinstance(k_solutes, np.ndarray) and k_solutes.ndim >= 2:
+            k_solutes = [k_solutes[..., idx, :]
+                         for idx in range(k_solutes.shape[-2])]
+        if len(k_solutes) != self.k_solutes.shape[0]:
+            raise ValueError(
+                'k_solutes must contain {} K sets, but contains {}.'.format(
+                    self.k_solutes.shape[0], len(k_solutes)))
+
+        n_k = self.k_solutes.shape[1]
+        k_sets = []
+        for curr_k_set in k_solutes:
+            curr_k_set = np.atleast_1d(np.asarray(curr_k_set, dtype=float))
+            if curr_k_set.shape[-1] > n_k:
+                if (curr_k_set[..., n_k:] != 0).any():
+                    raise ValueError(
+                        'The K sets can only be trimmed to {} values if the '
+                        'removed values are zero, but they are {}.'.format(
+                            n_k, curr_k_set[..., n_k:]))
+                curr_k_set = curr_k_set[..., :n_k]
+            else:
+                curr_k_set = np.pad(
+                    curr_k_set, [(0, 0)]*(curr_k_set.ndim-1) +
+                    [(0, n_k-curr_k_set.shape[-1])])
+            k_sets.append(curr_k_set)
+        k_solutes = np.stack(np.broadcast_arrays(*k_sets), axis=-2)
+
+        if ((k_solutes != 0) != (self.k_solutes != 0)).any():
+            raise ValueError(
+                'The zero K values in k_solutes must be at the same positions '
+                'as in {}.'.format(self.k_solutes))
+        return k_solutes
+
+    def equation_grid(self, c_h_plus, k_solutes=None, kw=None):
+        """
+        Evaluate self.equation numerically for many H+ concentrations and
+        sets of dissociation constants at once.
+
+        Parameters
+        ----------
+        c_h_plus : ndarray
+            A 1D array of H+ concentrations in mol/L.
+        k_solutes : list or ndarray, optional
+            The acid dissociation constants to use instead of
+            self.k_solutes. If it is a list, it must contain one entry per
+            solute like the k_solutes argument of the init method. Each entry
+            is a K set, optionally with leading axes (e.g. for different
+            temperatures), so the K values of the solutes can be given with
+            different lengths and leading axes which are broadcast against
+            each other. If it is an ndarray with at least two dimensions, the
+            second last axis runs over the solutes and the last axis over the
+            K values. The K sets are padded with zeros or trimmed to the
+            length of the K sets in self.k_solutes, trimming is only allowed
+            if the removed K values are zero. The zero K values must be at
+            the same positions as in self.k_solutes. Any leading axes are
+            kept in the result. The default is None, meaning that
+            self.k_solutes is used.
+        kw : float or ndarray, optional
+            The ion product of water, must be broadcastable to the leading
+            axes of k_solutes. The default is None, meaning that self.kw is
+            used.
+
+        Returns
+        -------
+        ndarray
+            The values of self.equation. The shape is the leading axes of
+            k_solutes followed by len(c_h_plus).
+
+        """
+        if k_solutes is None:
+            k_solutes = self.k_solutes
+        if kw is None:
+            kw = self.kw
+        k_solutes = self._fit_k_solutes(k_solutes)
+        kw = np.asarray(kw, dtype=float)
+        c_h_plus = np.asarray(c_h_plus, dtype=float)
+
+        # The number of protons is taken from self.k_solutes, _fit_k_solutes
+        # makes sure that the zeros are at the same positions for all K sets.
+        n = np.sum(self.k_solutes != 0, axis=1)
+
+        # Products of the first j K values, j = 0...len(K set). The
+        # term h_plus**(n-j)*k_prod[j] is proportional to the fraction of the
+        # solute carrying n-j protons.
+        k_prod = np.cumprod(np.concatenate(
+            [np.ones(k_solutes.shape[:-1] + (1,)), k_solutes], axis=-1),
+            axis=-1)
+        n_prot = n[:, np.newaxis] - np.arange(k_prod.shape[-1])
+
+        terms = (k_prod[..., np.newaxis, :, :] *
+                 c_h_plus[:, np.newaxis, np.newaxis]**n_prot)
+        mean_prot = np.sum(n_prot*terms, axis=-1)/np.sum(terms, axis=-1)
+        func = mean_prot - self.prot_left
+
+        delta = c_h_plus - kw[..., np.newaxis]/c_h_plus
+        return np.sum(func*self.c_solutes, axis=-1) + delta
+
 
 class titration():
     def __init__(self, k_analyte, k_titrant, c_analyte, c_titrant,
@@ -212,6 +309,56 @@ class titration():
         self.latest_curve = (v_titrant, ph)
         return self.latest_curve
 
+    def curve_grid(self, v_analyte, ph, k_analyte=None, k_titrant=None,
+                   kw=None):
+        """
+        Calculate titration curves for many sets of dissociation constants
+        at once, e.g. for different temperatures.
+
+        The concentrations and the numbers of residual protons are taken from
+        the instance, only the K values and kw are replaced. The curves are
+        evaluated numerically on the pH grid, so no new titration instance is
+        needed for every temperature. In contrast to self.curve, the pH
+        values are not checked against the analyte/titrant pH values, so
+        parts of the curves may lie outside of the physically meaningful
+        range (negative titrant volumes).
+
+        Parameters
+        ----------
+        v_analyte : float
+            The volume of the analyte solution in litres.
+        ph : ndarray
+            A 1D array of the pH values the titrant volume is calculated for.
+        k_analyte : list or ndarray, optional
+            The acid dissociation constants of the analyte solutes in the
+            formats accepted by solution.equation_grid, leading axes are kept
+            in the result. A temperature series is a list with the output of
+            k_values.k_at_temperature for each solute. The default is None,
+            meaning the K values given during initialization are used.
+        k_titrant : list or ndarray, optional
+            The same as k_analyte for the titrant solutes. The default is
+            None.
+        kw : float or ndarray, optional
+            The ion product of water, e.g. from
+            k_values.kw_at_temperature. Must be broadcastable to the leading
+            axes of k_analyte and k_titrant. The default is None, meaning the
+            kw value given during initialization is used.
+
+        Returns
+        -------
+        ndarray
+            The titrant volumes in litres. The shape is the leading axes of
+            k_analyte/k_titrant followed by len(ph).
+
+        """
+        c_h_plus = 10**(-np.asarray(ph, dtype=float))
+        analyte_values = self.analyte.equation_grid(
+            c_h_plus, k_solutes=k_analyte, kw=kw)
+        titrant_values = self.titrant.equation_grid(
+            c_h_plus, k_solutes=k_titrant, kw=kw)
+
+        return -v_analyte*analyte_values/titrant_values
+
     def curve_derivative(self, order=1):
         if self.latest_curve is None:
             raise ValueError('self.latest_curve is None. Run self.curve(...) '
@@ -6,11 +6,13 @@ Created on Sat Oct 16 19:59:07 2021
 @author: Alexander Southan
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
 import unittest
 
 from src.pyTitration.titration import titration
-from src.pyTitration.k_values import k_values
+from src.pyTitration.k_values import (
+    k_values, k_at_temperature, kw_at_temperature)
 
 
 class TestController(unittest.TestCase):
@@ -60,3 +62,116 @@ class TestController(unittest.TestCase):
         plt.plot(x0, y0, x1, y1, x2, y2, x3, y3)
         plt.xlabel('$V_\mathrm{titrant}$ [L]')
         plt.ylabel('pH')
+
+    def test_curve_grid(self):
+        temperatures = np.array([10, 25, 40])
+        k_analyte = k_at_temperature('carbonic acid', temperatures)
+        k_titrant = k_at_temperature('water', temperatures)
+        kw = kw_at_temperature(temperatures)
+
+        self.assertEqual(k_analyte.shape, (3, 3))
+        np.testing.assert_allclose(
+            k_analyte[1], k_values['acid']['carbonic acid'])
+        self.assertAlmostEqual(np.log10(kw[1]), -13.995)
+        # dissociation of water and carbonic acid is endothermic
+        self.assertTrue((np.diff(kw) > 0).all())
+        self.assertTrue((np.diff(k_analyte[:, :2], axis=0) > 0).all())
+        self.assertRaises(ValueError, kw_at_temperature, 110)
+        self.assertRaises(ValueError, k_at_temperature, 'unobtainium', 25)
+        self.assertRaises(ValueError, k_at_temperature, 'water', -273.15)
+        self.assertRaises(ValueError, k_at_temperature, 'acetic acid', 150)
+        self.assertRaises(ValueError, k_at_temperature, 'acetic acid', 25,
+                          kind='salt')
+
+        # water K and kw come from the same table
+        k_water = k_at_temperature('water', [0, 37, 90])
+        np.testing.assert_allclose(
+            k_water[:, 0]*1E-14/k_values['acid']['water'].iloc[0],
+            kw_at_temperature([0, 37, 90]))
+        np.testing.assert_allclose(
+            k_at_temperature('phosphoric acid', 25, kind='base'),
+            kw_at_temperature(25)/k_values['acid']['phosphoric acid'][::-1])
+
+        acid_titration = titration(
+            k_analyte=[k_values['acid']['carbonic acid']],
+            k_titrant=[k_values['acid']['water']],
+            c_analyte=[0.1], c_titrant=[0.1],
+            prot_left_ana=[2], prot_left_tit=[0])
+        v_titrant, ph = acid_titration.curve(
+            0.5, indep_var_min=4, indep_var_max=11, indep_var='pH',
+            data_points=50)
+        np.testing.assert_allclose(acid_titration.curve_grid(0.5, ph),
+                                   v_titrant)
+
+        v_grid = acid_titration.curve_grid(
+            0.5, ph, k_analyte=k_analyte[:, np.newaxis],
+            k_titrant=k_titrant[:, np.newaxis], kw=kw)
+        self.assertEqual(v_grid.shape, (3, 50))
+        for curr_v, curr_t in zip(v_grid, temperatures):
+            curr_titration = titration(
+                k_analyte=[k_at_temperature('carbonic acid', curr_t)],
+                k_titrant=[k_at_temperature('water', curr_t)],
+                c_analyte=[0.1], c_titrant=[0.1],
+                prot_left_ana=[2], prot_left_tit=[0],
+                kw=kw_at_temperature(curr_t))
+            curr_v_titrant, _ = curr_titration.curve(
+                0.5, indep_var_min=4, indep_var_max=11, indep_var='pH',
+                data_points=50)
+            np.testing.assert_allclose(curr_v, curr_v_titrant)
+
+        # titration built with unpadded K sets
+        unpadded_titration = titration(
+            k_analyte=[[4.46E-7, 4.69E-11]],
+            k_titrant=[[10**-15.74]],
+            c_analyte=[0.1], c_titrant=[0.1],
+            prot_left_ana=[2], prot_left_tit=[0])
+        np.testing.assert_allclose(
+            unpadded_titration.curve_grid(
+                0.5, ph, k_analyte=k_analyte[:, np.newaxis],
+                k_titrant=[k_titrant], kw=kw),
+            v_grid)
+        self.assertRaises(
+            ValueError, unpadded_titration.curve_grid, 0.5, ph,
+            k_analyte=[k_at_temperature('phosphoric acid', temperatures)])
+        self.assertRaises(
+            ValueError, unpadded_titration.curve_grid, 0.5, ph,
+            k_analyte=[[4.46E-7]])
+
+        # mixture with K sets of different lengths
+        mix = ['hydrochloric acid', 'phosphoric acid', 'acetic acid']
+        mix_titration = titration(
+            k_analyte=[[1E7], k_values['acid']['phosphoric acid'].tolist(),
+                       [10**-4.75]],
+            k_titrant=[k_values['acid']['water']],
+            c_analyte=[0.01, 0.05, 0.05], c_titrant=[0.5],
+            prot_left_ana=[1, 3, 1], prot_left_tit=[0])
+        v_titrant, ph = mix_titration.curve(
+            0.5, indep_var_min=2, indep_var_max=12, indep_var='pH',
+            data_points=50)
+        np.testing.assert_allclose(mix_titration.curve_grid(0.5, ph),
+                                   v_titrant)
+        np.testing.assert_allclose(
+            mix_titration.curve_grid(
+                0.5, ph, k_analyte=[[1E7],
+                                    k_values['acid']['phosphoric acid'],
+                                    [10**-4.75]]),
+            v_titrant)
+
+        v_grid = mix_titration.curve_grid(
+            0.5, ph,
+            k_analyte=[k_at_temperature(curr_acid, temperatures)
+                       for curr_acid in mix],
+            k_titrant=[k_titrant], kw=kw)
+        self.assertEqual(v_grid.shape, (3, 50))
+        for curr_v, curr_t in zip(v_grid, temperatures):
+            curr_titration = titration(
+                k_analyte=[k_at_temperature(curr_acid, curr_t).tolist()
+                           for curr_acid in mix],
+                k_titrant=[k_at_temperature('water', curr_t)],
+                c_analyte=[0.01, 0.05, 0.05], c_titrant=[0.5],
+                prot_left_ana=[1, 3, 1], prot_left_tit=[0],
+                kw=kw_at_temperature(curr_t))
+            curr_v_titrant, _ = curr_titration.curve(
+                0.5, indep_var_min=2, indep_var_max=12, indep_var='pH',
+                data_points=50)
+            np.testing.assert_allclose(curr_v, curr_v_titrant)